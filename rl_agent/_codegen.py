@@ -0,0 +1,246 @@
+# ============================================
+# _codegen — config-specialized pure-Python simulator
+# ============================================
+# Without Numba, sim_core.simulate_priority runs as generic Python over NumPy
+# arrays, which is slow: every element access boxes a scalar and every loop
+# re-reads the table shapes.  The event config is fixed for a process, so
+# instead emit source for one straight-line function with the number of
+# items, creatures and resources baked in: per-slot locals instead of arrays,
+# affordability checks unrolled over only the resources each item can cost,
+# and the advance step unrolled per creature.  The result is exec'd once.
+#
+# The generated functions follow simulate_priority / resume_priority tick for
+# tick and return bit-identical damage; they only skip the periodic
+# reachability check, so they keep ticking until every listed purchase is made.
+#
+# specialize_advance() does the same for GameSim.run_interval: one divmod and
+# two adds per creature slot, with each slot's resource index baked in.
+
+import functools
+import math
+
+import numpy as np
+
+from config import BOOST_DAMAGE, BOOST_PRODUCTION, BOOST_SPEED
+
+
+def _names(prefix, n):
+    """"p0, p1, …" for n locals, as an unpacking target (trailing comma if n == 1)."""
+    return ", ".join(f"{prefix}{i}" for i in range(n)) + ("," if n == 1 else "")
+
+
+def _effects_source(flat):
+    """Source of _effects(b0, b1, …) → (speed, dmg_mult, pb0, pb1, …)."""
+    n_res = flat.cost.shape[2]
+    n_b   = flat.boost_type.shape[0]
+    args  = ", ".join(f"b{j}" for j in range(n_b))
+    lines = [f"def _effects({args}):"]
+
+    def chain(target, boosts, expr, default):
+        # first boost of the kind with lv > 0 wins, as in sim_core._boost_effects
+        for n, j in enumerate(boosts):
+            kw = "if" if n == 0 else "elif"
+            lines.append(f"    {kw} b{j}:")
+            lines.append(f"        {target} = {expr.format(j=j)}")
+        if boosts:
+            lines.append("    else:")
+            lines.append(f"        {target} = {default}")
+        else:
+            lines.append(f"    {target} = {default}")
+
+    types = flat.boost_type.tolist()
+    chain("speed", [j for j in range(n_b) if types[j] == BOOST_SPEED],
+          "1.0 - BONUS{j}[b{j}]", "1.0")
+    chain("dmg", [j for j in range(n_b) if types[j] == BOOST_DAMAGE],
+          "1.0 + BONUS{j}[b{j}]", "1.0")
+    res = flat.boost_resource.tolist()
+    for r in range(n_res):
+        chain(f"pb{r}", [j for j in range(n_b)
+                         if types[j] == BOOST_PRODUCTION and res[j] == r],
+              "BONUS{j}[b{j}]", "0.0")
+    pbs = "".join(f", pb{r}" for r in range(n_res))
+    lines.append(f"    return speed, dmg{pbs}")
+    return lines
+
+
+def _cost_columns(rows):
+    """
+    Resources worth checking for one item: those any purchasable step costs.
+    Unpurchasable steps are all-inf, so any one column still rejects them.
+    """
+    finite = [row for row in rows if not all(math.isinf(c) for c in row)]
+    cols = [r for r in range(len(rows[0])) if any(row[r] != 0.0 for row in finite)]
+    return cols or [0]
+
+
+def simulate_source(flat, duration_ms, step_ms):
+    """
+    Source of _resume_specialized(positions, counts, resources, progress,
+    total, elapsed) and _simulate_specialized(positions) for the given
+    flattened config, plus the namespace of constant tables they read.
+    """
+    n_items     = flat.cost.shape[0]
+    n_creatures = flat.spawn_time.shape[0]
+    n_res       = flat.cost.shape[2]
+    n_b         = n_items - n_creatures
+    produces    = flat.produces.tolist()
+    start       = flat.start_levels.tolist()
+
+    ns = {'_DURATION': float(duration_ms), '_STEP': float(step_ms),
+          '_NO_COUNTS': np.zeros(n_items, dtype=np.int64),
+          '_NO_RES': np.zeros(n_res), '_NO_PROGRESS': np.zeros(n_creatures)}
+    for k in range(n_items):
+        ns[f"C{k}"] = tuple(tuple(row) for row in flat.cost[k].tolist())
+    for i in range(n_creatures):
+        ns[f"ST{i}"]   = float(flat.spawn_time[i])
+        ns[f"PROD{i}"] = tuple(flat.production[i].tolist())
+        ns[f"DMG{i}"]  = tuple(flat.damage[i].tolist())
+    for j in range(n_b):
+        ns[f"BONUS{j}"] = tuple(flat.bonus[j].tolist())
+
+    # level locals: lv{i} for creatures, b{j} for boosts (item n_creatures + j)
+    lvl = [f"lv{k}" if k < n_creatures else f"b{k - n_creatures}"
+           for k in range(n_items)]
+    bargs = ", ".join(f"b{j}" for j in range(n_b))
+    pbs   = ", ".join(f"pb{r}" for r in range(n_res))
+
+    src = _effects_source(flat)
+    src += [
+        "",
+        "def _simulate_specialized(positions):",
+        "    return _resume_specialized(positions, _NO_COUNTS, _NO_RES, _NO_PROGRESS,",
+        "                               0.0, 0.0)",
+        "",
+        "def _resume_specialized(positions, counts, resources, progress, total, elapsed):",
+        "    sentinel = int(positions.max())",
+        "    rows = positions.tolist()",
+        "    counts = counts.tolist()",
+        "    n_left = sum(p < sentinel for row, s in zip(rows, counts) for p in row[s:])",
+        f"    {_names('s', n_items)} = counts",
+        f"    {_names('r', n_res)} = resources.tolist()",
+        f"    {_names('pr', n_creatures)} = progress.tolist()",
+    ]
+    src += [f"    P{k} = rows[{k}]" for k in range(n_items)]
+    src += [f"    {lvl[k]} = {start[k]} + s{k}" for k in range(n_items)]
+    src += [
+        f"    speed, dmg, {pbs} = _effects({bargs})",
+        "    while elapsed < _DURATION:",
+        "        if n_left == 0:",
+        "            break",
+        "        best = sentinel         # padded (unlisted) levels are never bought",
+        "        k = -1",
+    ]
+    for k in range(n_items):
+        cols = _cost_columns(ns[f"C{k}"])
+        test = " and ".join(f"r{r} >= c[{r}]" for r in cols)
+        src += [
+            f"        p = P{k}[s{k}]",
+            "        if p < best:",
+            f"            c = C{k}[s{k}]",
+            f"            if {test}:",
+            "                best = p",
+            f"                k = {k}",
+        ]
+    # k >= 0 only for a listed purchase, which is what n_left counts
+    src += ["        if k >= 0:", "            n_left -= 1"]
+    for k in range(n_items):
+        cols = _cost_columns(ns[f"C{k}"])
+        src.append(f"            {'if' if k == 0 else 'elif'} k == {k}:")
+        src.append(f"                c = C{k}[s{k}]")
+        src += [f"                r{r} -= c[{r}]" for r in cols]
+        src.append(f"                s{k} += 1")
+        src.append(f"                {lvl[k]} += 1")
+        if k >= n_creatures:
+            src.append(f"                speed, dmg, {pbs} = _effects({bargs})")
+    for i in range(n_creatures):
+        src += [
+            f"        if lv{i}:",
+            f"            st = ST{i} * speed",
+            f"            pr{i} += _STEP",
+            f"            t = int(pr{i} / st)",
+            "            if t:",
+            f"                pr{i} -= t * st",
+            f"                r{produces[i]} += (PROD{i}[lv{i}] + pb{produces[i]}) * t",
+            f"                total += DMG{i}[lv{i}] * dmg * t",
+        ]
+    src += [
+        "        elapsed += _STEP",
+        "    if elapsed < _DURATION:",
+        "        # nothing left to buy: every rate is fixed for the rest of the run",
+        "        n_steps = 0",
+        "        while elapsed < _DURATION:",
+        "            elapsed += _STEP",
+        "            n_steps += 1",
+    ]
+    for i in range(n_creatures):
+        src += [
+            f"        if lv{i}:",
+            f"            total += DMG{i}[lv{i}] * dmg * int((pr{i} + n_steps * _STEP)"
+            f" / (ST{i} * speed))",
+        ]
+    src.append("    return total")
+    return "\n".join(src) + "\n", ns
+
+
+def specialize_priority(flat, duration_ms, step_ms):
+    """
+    Compile config-specialized drop-ins for
+    simulate_priority(positions, *flat, duration_ms, step_ms) and
+    resume_priority(positions, *state, *flat, duration_ms, step_ms), where
+    state is (counts, resources, progress, total, elapsed).  Returns both.
+    """
+    src, ns = simulate_source(flat, duration_ms, step_ms)
+    exec(compile(src, "<_simulate_specialized>", "exec"), ns)
+    simulate, resume = ns['_simulate_specialized'], ns['_resume_specialized']
+    simulate.__source__ = resume.__source__ = src
+    return simulate, resume
+
+
+def advance_source(produces, n_res):
+    """
+    Source of _advance_specialized(…) for creatures producing resources
+    produces[i] out of n_res; nothing else about the config is baked in.
+    """
+    n_creatures = len(produces)
+
+    src = [
+        "def _advance_specialized(progress, eff_spawn, active, prod_rate, dmg_rate,",
+        "                         delta, resources, damage_acc):",
+        f"    {_names('p', n_creatures)} = progress.tolist()",
+        f"    {_names('e', n_creatures)} = eff_spawn.tolist()",
+        f"    {_names('a', n_creatures)} = active.tolist()",
+        f"    {_names('pr', n_creatures)} = prod_rate.tolist()",
+        f"    {_names('dm', n_creatures)} = dmg_rate.tolist()",
+        f"    {_names('r', n_res)} = resources.tolist()",
+        "    total = damage_acc.item()",
+    ]
+    # locked slots have a = 0, so they gain no progress and spawn nothing
+    for i in range(n_creatures):
+        src += [
+            f"    t, p{i} = divmod(p{i} + delta * a{i}, e{i})",
+            f"    r{produces[i]} += pr{i} * t",
+            f"    total += dm{i} * t",
+        ]
+    src += [
+        f"    progress[:] = ({_names('p', n_creatures)})",
+        f"    resources[:] = ({_names('r', n_res)})",
+        "    damage_acc[0] = total",
+    ]
+    return "\n".join(src) + "\n"
+
+
+@functools.lru_cache(maxsize=None)
+def specialize_advance(produces, n_res):
+    """
+    Compile a config-specialized drop-in for GameSim.run_interval's NumPy
+    path, once per (produces, n_res) layout:
+    _advance_specialized(progress, eff_spawn, active, prod_rate, dmg_rate,
+    delta, resources, damage_acc) updates progress, resources and damage_acc
+    in place (the rate arrays are only read), adding in slot order like
+    np.add.at.
+    """
+    src, ns = advance_source(produces, n_res), {}
+    exec(compile(src, "<_advance_specialized>", "exec"), ns)
+    fn = ns['_advance_specialized']
+    fn.__source__ = src
+    return fn
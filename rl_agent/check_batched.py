@@ -0,0 +1,67 @@
+# ============================================
+# BatchedGameSim self-check
+# ============================================
+# Drives a BatchedGameSim and one GameSim per row through the same random
+# purchases for a full event and checks that every row matches its GameSim
+# bit for bit (damage, balances, levels).
+# Usage:
+#   cd rl_agent
+#   python check_batched.py [batch_size] [seed]
+# ============================================
+
+import sys
+
+import numpy as np
+
+from config import ITEM_KEYS
+from simulation import BatchedGameSim, GameSim
+
+STEP_MS = 60_000
+
+
+def check(batch_size=16, seed=1):
+    """Run the comparison; returns the list of mismatch descriptions (empty = OK)."""
+    rng   = np.random.default_rng(seed)
+    batch = BatchedGameSim(batch_size)
+    sims  = [GameSim(batch.config) for _ in range(batch_size)]
+    problems = []
+
+    while not batch.is_done():
+        for k in rng.permutation(len(ITEM_KEYS)).tolist():
+            kind, uid = ITEM_KEYS[k]
+            want   = rng.random(batch_size) < 0.5
+            bought = batch.upgrade(kind, uid, want)
+            for b, sim in enumerate(sims):
+                ok = want[b] and (sim.upgrade_creature(uid) if kind == 'creature'
+                                  else sim.upgrade_boost(uid))
+                if ok != bought[b]:
+                    problems.append(f"row {b}: purchase of {uid} differs "
+                                    f"at {batch.time_elapsed_ms:.0f} ms")
+        batch.advance(STEP_MS)
+        for sim in sims:
+            sim.advance(STEP_MS)
+
+    damage = batch.total_damage
+    for b, sim in enumerate(sims):
+        if damage[b] != sim.total_damage:
+            problems.append(f"row {b}: damage {damage[b]!r} != {sim.total_damage!r}")
+        if not (batch.resources_vec[b] == sim.resources_vec).all():
+            problems.append(f"row {b}: balances differ")
+        for kind, uid in ITEM_KEYS:
+            if batch.level(kind, uid)[b] != sim.level(kind, uid):
+                problems.append(f"row {b}: level of {uid} differs")
+    return problems
+
+
+def main():
+    args = [int(a) for a in sys.argv[1:3]]
+    problems = check(*args)
+    for p in problems:
+        print(" ", p)
+    print("BatchedGameSim matches GameSim" if not problems
+          else f"{len(problems)} mismatches")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
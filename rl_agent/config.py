@@ -3,6 +3,10 @@
 # Keep this in sync with the JS config file.
 # ============================================
 
+from collections import namedtuple
+
+import numpy as np
+
 TIME_FACTOR = 5
 HOURS = 60 * 60 * 1000          # milliseconds per hour
 EVENT_DURATION_HOURS = 72 / TIME_FACTOR   # 14.4 hours
@@ -212,3 +216,123 @@ EVENT_CONFIG = {
         },
     ],
 }
+
+
+# ============================================
+# Flattened tables — built once at import
+# ============================================
+# Integer-indexed view of a config for the simulators' hot paths, so they
+# never walk the dicts above.  Item ids: creatures 0..C-1 in config order,
+# then boosts C..C+B-1.
+
+BOOST_PRODUCTION = 0
+BOOST_SPEED      = 1
+BOOST_DAMAGE     = 2
+
+_BOOST_TYPES = {
+    'production-bonus': BOOST_PRODUCTION,
+    'speed':            BOOST_SPEED,
+    'damage':           BOOST_DAMAGE,
+}
+
+
+FlatConfig = namedtuple('FlatConfig', [
+    'cost',             # float64[K, S+1, R]  cost of the s-th purchase of item k (inf = never)
+    'start_levels',     # int64[K]            level of each item at t=0
+    'spawn_time',       # float64[C]          base spawn time (ms)
+    'produces',         # int64[C]            resource index each creature produces
+    'production',       # float64[C, L+1]     production at level lv (column 0 unused)
+    'damage',           # float64[C, L+1]     damage at level lv (column 0 unused)
+    'boost_type',       # int64[B]            BOOST_PRODUCTION / BOOST_SPEED / BOOST_DAMAGE
+    'boost_resource',   # int64[B]            resource index for production boosts, else -1
+    'bonus',            # float64[B, L+1]     bonus at level lv (column 0 unused)
+])
+
+
+def _n_purchases(item, kind):
+    """Number of purchases available for an item (matches build_template)."""
+    if kind == 'creature' and item.get('unlockedByDefault'):
+        return item['maxLevel'] - 1
+    return item['maxLevel']
+
+
+def index_maps(config):
+    """uid → index maps (resources, creature slots, boost slots) for config."""
+    return ({r['id']: i for i, r in enumerate(config['resources'])},
+            {c['id']: i for i, c in enumerate(config['creatures'])},
+            {b['id']: j for j, b in enumerate(config.get('boosts', []))})
+
+
+def flatten_config(config):
+    """
+    config → (ITEM_KEYS, FlatConfig)
+
+    ITEM_KEYS[k] is the (kind, uid) of item id k.  Creatures occupy ids
+    0..C-1 in config order, boosts C..C+B-1.
+    """
+    creatures = config['creatures']
+    boosts    = config.get('boosts', [])
+    res_index = index_maps(config)[0]
+
+    items = ([('creature', c) for c in creatures] +
+             [('boost', b) for b in boosts])
+    keys  = [(kind, item['id']) for kind, item in items]
+
+    n_res     = len(res_index)
+    max_steps = max(_n_purchases(item, kind) for kind, item in items)
+    max_level = max(item['maxLevel'] for _, item in items)
+
+    def cost_row(cost):
+        row = np.zeros(n_res)
+        for r, amt in cost.items():
+            row[res_index[r]] = amt
+        return row
+
+    cost = np.full((len(items), max_steps + 1, n_res), np.inf)
+    for k, (kind, item) in enumerate(items):
+        if kind == 'creature':
+            steps = list(item['upgradeCosts'][:item['maxLevel'] - 1])
+            if not item.get('unlockedByDefault'):
+                steps.insert(0, item.get('unlockCost'))
+        else:
+            steps = item['costs'][:item['maxLevel']]
+        for s, c in enumerate(steps):
+            if c:                       # None / {} are never purchasable
+                cost[k, s] = cost_row(c)
+
+    start_levels = np.array(
+        [1 if kind == 'creature' and item.get('unlockedByDefault') else 0
+         for kind, item in items], dtype=np.int64)
+
+    production = np.zeros((len(creatures), max_level + 1))
+    damage     = np.zeros((len(creatures), max_level + 1))
+    for i, c in enumerate(creatures):
+        production[i, 1:len(c['productionByLevel']) + 1] = c['productionByLevel']
+        damage[i, 1:len(c['damageByLevel']) + 1]         = c['damageByLevel']
+
+    bonus = np.zeros((len(boosts), max_level + 1))
+    for j, b in enumerate(boosts):
+        bonus[j, 1:len(b['bonusByLevel']) + 1] = b['bonusByLevel']
+
+    flat = FlatConfig(
+        cost           = cost,
+        start_levels   = start_levels,
+        spawn_time     = np.array([c['spawnTime'] for c in creatures], dtype=np.float64),
+        produces       = np.array([res_index[c['produces']] for c in creatures], dtype=np.int64),
+        production     = production,
+        damage         = damage,
+        boost_type     = np.array([_BOOST_TYPES[b['type']] for b in boosts], dtype=np.int64),
+        boost_resource = np.array([res_index.get(b.get('resource'), -1) for b in boosts],
+                                  dtype=np.int64),
+        bonus          = bonus,
+    )
+    return keys, flat
+
+
+ITEM_KEYS, FLAT = flatten_config(EVENT_CONFIG)
+N_ITEMS   = len(ITEM_KEYS)
+MAX_STEPS = FLAT.cost.shape[1] - 1
+DURATION  = float(EVENT_CONFIG['duration'])
+
+# uid → index maps, for use at API boundaries only (GameSim maps uids with them)
+RESOURCE_BY_ID, CREATURE_BY_ID, BOOST_BY_ID = index_maps(EVENT_CONFIG)
@@ -6,8 +6,6 @@
 #   python evaluate.py
 # ============================================
 
-import copy
-
 from simulation import GameSim
 from config import EVENT_CONFIG
 from optimizer import optimize, simulate_with_log
@@ -43,23 +41,13 @@ def _score_upgrade(sim_orig, kind, uid, time_remaining_ms):
     else:
         cost = sim_orig.get_boost_upgrade_cost(uid)
 
-    if cost is None or not sim_orig.can_afford(cost):
+    if cost is None or not sim_orig.can_afford(*sim_orig.upgrade_step(kind, uid)):
         return None
 
     current_dps = sim_orig.get_dps()
+    new_dps     = sim_orig.get_dps_after(kind, uid)
 
-    sim2 = copy.copy(sim_orig)
-    sim2.resources         = dict(sim_orig.resources)
-    sim2.creature_levels   = dict(sim_orig.creature_levels)
-    sim2.creature_unlocked = dict(sim_orig.creature_unlocked)
-    sim2.boost_levels      = dict(sim_orig.boost_levels)
-
-    if kind == 'creature':
-        sim2.upgrade_creature(uid)
-    else:
-        sim2.upgrade_boost(uid)
-
-    dps_gain   = sim2.get_dps() - current_dps
+    dps_gain   = new_dps - current_dps
     time_s     = time_remaining_ms / 1000.0
     total_cost = sum(cost.values()) or 1.0
 
@@ -97,14 +85,18 @@ def run_greedy():
 
         if best_kind == 'creature':
             sim.upgrade_creature(best_uid)
-            lv = sim.creature_levels[best_uid]
+            lv = sim.level('creature', best_uid)
             log.append({'time_h': sim.time_elapsed_ms / 3_600_000,
                         'action': f"Upgrade {best_name} → Lv{lv}"})
         elif best_kind == 'boost':
             sim.upgrade_boost(best_uid)
-            lv = sim.boost_levels[best_uid]
+            lv = sim.level('boost', best_uid)
             log.append({'time_h': sim.time_elapsed_ms / 3_600_000,
                         'action': f"Buy {best_name} Lv{lv}"})
+        else:
+            # nothing affordable: run ahead to the first tick where something is
+            sim.advance_bulk(sim.steps_left(STEP_MS), STEP_MS, sim.next_costs())
+            continue
 
         sim.advance(STEP_MS)
 
@@ -121,7 +113,7 @@ def run_sa(n_iter=30_000, n_restarts=5, seed=42):
         n_iter=n_iter, n_restarts=n_restarts,
         hill_climb_passes=3, verbose=True, seed=seed,
     )
-    damage, log, sim = simulate_with_log(best_priority)
+    damage, log, sim, _ = simulate_with_log(best_priority)
     return damage, log, sim
 
 
@@ -16,15 +16,27 @@ How it works:
   4. Return the best ordering found, plus its full purchase log
 """
 
+import contextlib
+import functools
+import os
 import random
 import math
 import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Optional
 
-from config import EVENT_CONFIG
-from simulation import GameSim
+import numpy as np
+
+from config import EVENT_CONFIG, FLAT, ITEM_KEYS, N_ITEMS, MAX_STEPS, DURATION
+from simulation import GameSim, PROGRESS_UNITS
+from sim_core import HAVE_NUMBA, simulate_priority, resume_priority
+from _codegen import specialize_priority
 
 STEP_MS = 60_000   # 1-minute steps → 864 steps per 14.4-hour episode
+CHECKPOINT_TICKS = 64   # simulate_with_log() snapshots the state this often
+SA_BATCH = 4096         # SA iterations' worth of random draws made per NumPy call
 
 
 # ============================================================
@@ -51,116 +63,222 @@ def build_template():
     return steps
 
 
+# Dense integer ids for every (kind, uid), shared with the sim_core kernel.
+# KEYS[k] is the (kind, uid) of id k; KEY_ID is the reverse lookup.
+KEYS       = ITEM_KEYS
+KEY_ID     = {key: k for k, key in enumerate(KEYS)}
+N_KEYS     = N_ITEMS
+MAX_LEVELS = MAX_STEPS
+_ROWS      = np.arange(N_KEYS)
+
+
 def _build_pos_map(priority):
     """
-    priority → dict: (kind, uid) → [sorted positions in the priority list]
+    priority → int32 array positions[key_id, i] of shape (N_KEYS, MAX_LEVELS + 1)
 
-    positions[i] holds the priority-list index of the i-th purchase of that uid.
+    positions[k, i] holds the priority-list index of the i-th purchase of key k,
+    padded with the sentinel len(priority) once every level has been listed.
     E.g. if Fiona appears at positions 3, 15, 40 …, then after buying Fiona L2
-    (counts = 1) we look at position 15 to decide her relative priority for L3.
+    (counts[k] = 1) we look at position 15 to decide her relative priority for L3.
+
+    Built without a Python loop: a stable sort groups the positions by key id
+    in list order, and each entry's level is its offset within its group.
+    """
+    n     = len(priority)
+    ids   = np.fromiter((KEY_ID[entry[:2]] for entry in priority), np.intp, n)
+    order = np.argsort(ids, kind='stable')
+    ids   = ids[order]
+    level = np.arange(n) - np.searchsorted(ids, ids)
+    positions = np.full((N_KEYS, MAX_LEVELS + 1), n, dtype=np.int32)
+    positions[ids, level] = order
+    return positions
+
+
+def _slot_levels(positions, n):
+    """slot_level[pos] = which purchase of its key priority[pos] is (0-based)."""
+    slot_level = [0] * n
+    for row in positions.tolist():
+        for lv, pos in enumerate(row):
+            if pos < n:
+                slot_level[pos] = lv
+    return slot_level
+
+
+def _first_levels(priority, slot_level, lo, hi):
+    """Lowest level of each key listed in priority[lo:hi]; call before editing it."""
+    first = {}
+    for pos in range(lo, hi):
+        first.setdefault(KEY_ID[priority[pos][:2]], slot_level[pos])
+    return first
+
+
+def _refresh_pos_map(positions, slot_level, priority, lo, hi, first):
     """
-    pos_map = {}
-    for pos, (kind, uid, _) in enumerate(priority):
-        key = (kind, uid)
-        if key not in pos_map:
-            pos_map[key] = []
-        pos_map[key].append(pos)
-    return pos_map
+    Patch positions / slot_level after priority[lo:hi] was permuted in place.
+
+    The permuted slice holds the same keys as before, and the levels a key
+    lists inside it are a contiguous run of its row starting at first[key],
+    so rewriting that run in the new order is all that changes — O(hi - lo).
+    """
+    for pos in range(lo, hi):
+        k  = KEY_ID[priority[pos][:2]]
+        lv = first[k]
+        first[k] = lv + 1
+        positions[k, lv] = pos
+        slot_level[pos]  = lv
+
+
+def _choose_upgrade(resources, next_pos, next_cost, n):
+    """
+    Return the id of the highest-priority key whose next level is affordable,
+    or -1 if nothing can be bought this tick.
+
+    next_pos[k] / next_cost[k] are the priority position and cost row of key
+    k's next purchase; exhausted keys have position n and an all-inf cost row,
+    so one vectorized compare covers every candidate at once.  Unaffordable
+    keys are masked to the sentinel n and a single argmin picks the winner.
+    """
+    afford    = (next_cost <= resources).all(axis=1)
+    effective = np.where(afford, next_pos, n)
+    k         = int(effective.argmin())
+    return k if effective[k] < n else -1
 
 
 # ============================================================
 # Simulation with priority list
 # ============================================================
 
+# Scorers for a position map, from t=0 or from a Trace checkpoint.  Without
+# Numba the generic kernels run as plain Python, so use straight-line
+# versions generated for this config.
+if HAVE_NUMBA:
+    def _simulate_positions(positions):
+        return simulate_priority(positions, *FLAT, DURATION, STEP_MS)
+
+    def _resume_positions(positions, *state):
+        return resume_priority(positions, *state, *FLAT, DURATION, STEP_MS)
+else:
+    _simulate_positions, _resume_positions = specialize_priority(FLAT, DURATION, STEP_MS)
+
+
 def simulate(priority) -> float:
     """
     Simulate a full event following the given priority ordering.
-    Returns total damage dealt.
+    Returns total damage dealt.  Runs the flat-array kernel in sim_core (or
+    its generated twin in _codegen without Numba); simulate_with_log() is the
+    GameSim-based equivalent (bit for bit under the whole-ms spawn time
+    assumption described in sim_core).
     """
-    sim     = GameSim(EVENT_CONFIG)
-    pos_map = _build_pos_map(priority)
-    counts  = {key: 0 for key in pos_map}
-    n       = len(priority)
+    return _simulate_cached(tuple(priority))
 
-    while not sim.is_done():
-        best_pos = n        # sentinel — no affordable upgrade found yet
-        best_key = None
-
-        for key, positions in pos_map.items():
-            c = counts[key]
-            if c >= len(positions):
-                continue        # all levels of this item already purchased
-            p = positions[c]
-            if p >= best_pos:
-                continue        # can't beat current best — early exit
-            kind, uid = key
-            cost = (sim.get_creature_upgrade_cost(uid) if kind == 'creature'
-                    else sim.get_boost_upgrade_cost(uid))
-            if cost and sim.can_afford(cost):
-                best_pos = p
-                best_key = key
-
-        if best_key is not None:
-            kind, uid = best_key
-            if kind == 'creature':
-                sim.upgrade_creature(uid)
-            else:
-                sim.upgrade_boost(uid)
-            counts[best_key] += 1
 
-        sim.advance(STEP_MS)
+@functools.lru_cache(maxsize=65536)
+def _simulate_cached(priority):
+    # priority fully determines the outcome, so repeated orderings are free
+    return _simulate_positions(_build_pos_map(priority))
+
 
-    return sim.total_damage
+# purchase_ticks: (kind, uid) → ticks at which each of its levels was bought.
+# checkpoints[c]:  state at the start of tick c * CHECKPOINT_TICKS as
+#                  (counts, resources, progress, total_damage, elapsed_ms),
+#                  in the argument layout of sim_core.resume_priority.
+Trace = namedtuple('Trace', ['purchase_ticks', 'checkpoints', 'n_ticks'])
+
+
+def _checkpoint(sim, counts):
+    # resume_priority takes progress in float ms, by creature slot
+    return (counts.astype(np.int64), sim.resources_vec.copy(), sim._progress_q / PROGRESS_UNITS,
+            sim.total_damage, sim.time_elapsed_ms)
 
 
 def simulate_with_log(priority):
-    """Like simulate() but also records every purchase and returns the final sim."""
-    sim     = GameSim(EVENT_CONFIG)
-    pos_map = _build_pos_map(priority)
-    name_map = {(kind, uid): name for kind, uid, name in priority}
-    counts  = {key: 0 for key in pos_map}
-    log     = []
-    n       = len(priority)
+    """
+    Like simulate() but also records every purchase and returns the final sim.
+    Returns (damage, log, sim, trace); trace lets hill_climb() replay swaps
+    from the tick where they first matter instead of from t=0.
+    """
+    sim       = GameSim(EVENT_CONFIG)
+    positions = _build_pos_map(priority)
+    name_map  = {(kind, uid): name for kind, uid, name in priority}
+    counts    = np.zeros(N_KEYS, dtype=np.int32)
+    next_pos  = positions[_ROWS, counts]
+    next_cost = FLAT.cost[_ROWS, counts]    # refreshed per key only on purchase
+    log       = []
+    n         = len(priority)
+    bought    = {key: [] for key in KEYS}
+    snapshots = []
+    tick      = 0
 
     while not sim.is_done():
-        best_pos = n
-        best_key = None
+        if tick % CHECKPOINT_TICKS == 0:
+            snapshots.append(_checkpoint(sim, counts))
 
-        for key, positions in pos_map.items():
-            c = counts[key]
-            if c >= len(positions):
-                continue
-            p = positions[c]
-            if p >= best_pos:
-                continue
-            kind, uid = key
-            cost = (sim.get_creature_upgrade_cost(uid) if kind == 'creature'
-                    else sim.get_boost_upgrade_cost(uid))
-            if cost and sim.can_afford(cost):
-                best_pos = p
-                best_key = key
-
-        if best_key is not None:
-            kind, uid = best_key
-            name = name_map[best_key]
+        k = _choose_upgrade(sim.resources_vec, next_pos, next_cost, n)
+        if k >= 0:
+            kind, uid = KEYS[k]
+            name = name_map[(kind, uid)]
             t_h  = sim.time_elapsed_ms / 3_600_000
 
             if kind == 'creature':
                 sim.upgrade_creature(uid)
-                lv = sim.creature_levels[uid]
+                lv = sim.level(kind, uid)
                 label = (f"Unlock {name}" if lv == 1
                          else f"Upgrade {name} → Lv{lv}")
             else:
                 sim.upgrade_boost(uid)
-                lv = sim.boost_levels[uid]
+                lv = sim.level(kind, uid)
                 label = f"Buy {name} Lv{lv}"
 
             log.append({'time_h': t_h, 'action': label})
-            counts[best_key] += 1
+            bought[(kind, uid)].append(tick)
+            counts[k] += 1
+            next_pos[k]  = positions[k, counts[k]]
+            next_cost[k] = FLAT.cost[k, counts[k]]
+            sim.advance(STEP_MS)
+            tick += 1
+        else:
+            # nothing affordable: run ahead to the first tick where something
+            # is, without passing the next checkpoint
+            n_max = min(CHECKPOINT_TICKS - tick % CHECKPOINT_TICKS, sim.steps_left(STEP_MS))
+            tick += sim.advance_bulk(n_max, STEP_MS, next_cost)
+
+    return sim.total_damage, log, sim, Trace(bought, snapshots, tick)
+
+
+# ============================================================
+# Zobrist hashing of priority orderings
+# ============================================================
+# _ZOBRIST[pos][(kind, uid)] is a random 64-bit word; the hash of an ordering
+# is the XOR over positions of the word for the (kind, uid) of the entry placed
+# there.  Only (kind, uid) decides the outcome, so display names are ignored
+# and orderings that only swap identical steps hash equal — they also
+# simulate identically.  A perturbation that touches
+# positions lo..hi-1 updates the hash in O(hi - lo) instead of O(n).
 
-        sim.advance(STEP_MS)
+def _build_zobrist(template, seed=0x1D1E):
+    rng   = random.Random(seed)     # private RNG: leaves the global stream alone
+    table = []
+    for _ in template:
+        table.append({key: rng.getrandbits(64) for key in KEYS})
+    return table
 
-    return sim.total_damage, log, sim
+
+_ZOBRIST = _build_zobrist(build_template())
+
+
+def _zobrist(priority):
+    h = 0
+    for pos, item in enumerate(priority):
+        h ^= _ZOBRIST[pos][item[:2]]
+    return h
+
+
+def _xor_range(h, priority, lo, hi):
+    """XOR the words of priority[lo:hi] into h — applied before and after an
+    in-place edit of that range, it turns the old ordering's hash into the new one's."""
+    for pos in range(lo, hi):
+        h ^= _ZOBRIST[pos][priority[pos][:2]]
+    return h
 
 
 # ============================================================
@@ -181,8 +299,7 @@ def simulated_annealing(n_iter: int = 20_000,
     Returns:
         (best_priority, best_damage)
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     template = build_template()
     n        = len(template)
@@ -192,9 +309,12 @@ def simulated_annealing(n_iter: int = 20_000,
         print(f"  Running {n_iter:,} SA iterations…\n")
 
     # ---- Initial solution: random shuffle ----
-    current       = list(template)
-    random.shuffle(current)
+    current       = [template[i] for i in rng.permutation(n).tolist()]
     current_score = simulate(current)
+    current_hash  = _zobrist(current)
+    positions     = _build_pos_map(current)     # kept in sync with current
+    slot_level    = _slot_levels(positions, n)
+    seen          = {current_hash: current_score}   # Zobrist hash → damage
 
     best       = list(current)
     best_score = current_score
@@ -208,42 +328,83 @@ def simulated_annealing(n_iter: int = 20_000,
 
     t0       = time.time()
     n_accept = 0
+    log      = math.log
 
     for i in range(n_iter):
-        # ---- Perturbation: one of three operators ----
-        r   = random.random()
-        nbr = list(current)
-
+        # ---- Random draws for the next SA_BATCH iterations, in a few C calls ----
+        j = i % SA_BATCH
+        if j == 0:
+            batch   = min(SA_BATCH, n_iter - i)
+            op_r    = rng.random(batch).tolist()
+            pos1    = rng.integers(0, n, batch).tolist()
+            pos2    = rng.integers(0, n - 1, batch).tolist()
+            lengths = rng.integers(2, min(8, n) + 1, batch).tolist()
+            accept  = (1.0 - rng.random(batch)).tolist()    # (0, 1] for the log
+        r = op_r[j]
+
+        # ---- Perturbation: one of three operators, applied to current in place ----
         if r < 0.50:
             # Swap two random positions (fine-grained)
-            a, b = random.sample(range(n), 2)
-            nbr[a], nbr[b] = nbr[b], nbr[a]
+            op   = 'swap'
+            a, b = pos1[j], pos2[j]
+            b   += b >= a               # distinct from a
+            lo, hi   = min(a, b), max(a, b) + 1
+            za, zb   = _ZOBRIST[a], _ZOBRIST[b]
+            ka, kb   = current[a][:2], current[b][:2]
+            nbr_hash = current_hash ^ za[ka] ^ za[kb] ^ zb[kb] ^ zb[ka]
+            first = _first_levels(current, slot_level, lo, hi)
+            current[a], current[b] = current[b], current[a]
 
         elif r < 0.85:
             # Relocate: remove one item and re-insert elsewhere (medium)
-            a    = random.randrange(n)
-            b    = random.randrange(n - 1)
-            item = nbr.pop(a)
-            nbr.insert(b, item)
+            op     = 'relocate'
+            a      = pos1[j]
+            b      = pos2[j]
+            lo, hi = min(a, b), max(a, b) + 1
+            h      = _xor_range(current_hash, current, lo, hi)
+            first  = _first_levels(current, slot_level, lo, hi)
+            current.insert(b, current.pop(a))
+            nbr_hash = _xor_range(h, current, lo, hi)
 
         else:
             # Reverse a short segment (good for local re-ordering)
-            a      = random.randrange(n)
-            length = random.randint(2, min(8, n))
+            op     = 'reverse'
+            a      = pos1[j]
+            length = lengths[j]
             b      = min(a + length, n)
-            nbr[a:b] = nbr[a:b][::-1]
-
-        nbr_score = simulate(nbr)
+            lo, hi = a, b
+            h      = _xor_range(current_hash, current, lo, hi)
+            first  = _first_levels(current, slot_level, lo, hi)
+            current[a:b] = current[a:b][::-1]
+            nbr_hash = _xor_range(h, current, a, b)
+
+        _refresh_pos_map(positions, slot_level, current, lo, hi, first)
+
+        nbr_score = seen.get(nbr_hash)
+        if nbr_score is None:
+            nbr_score = _simulate_positions(positions)
+            seen[nbr_hash] = nbr_score
         delta     = nbr_score - current_score
 
-        # Accept if better; accept worse with Boltzmann probability
-        if delta > 0 or random.random() < math.exp(delta / (temp * max(current_score, 1e6))):
-            current       = nbr
+        # Accept if better; accept worse with Boltzmann probability, tested in
+        # log space: u < exp(delta / scale)  ⇔  log(u) * scale < delta
+        if delta > 0 or log(accept[j]) * temp * max(current_score, 1e6) < delta:
             current_score = nbr_score
+            current_hash  = nbr_hash
             n_accept     += 1
             if nbr_score > best_score:
-                best       = list(nbr)
+                best       = list(current)
                 best_score = nbr_score
+        else:
+            # Rejected: undo the perturbation (every operator has a cheap inverse)
+            first = _first_levels(current, slot_level, lo, hi)
+            if op == 'swap':
+                current[a], current[b] = current[b], current[a]
+            elif op == 'relocate':
+                current.insert(a, current.pop(b))
+            else:
+                current[a:b] = current[a:b][::-1]
+            _refresh_pos_map(positions, slot_level, current, lo, hi, first)
 
         temp *= cooling
 
@@ -266,29 +427,125 @@ def simulated_annealing(n_iter: int = 20_000,
 # Hill climbing — exhaustive single-pass swap search
 # ============================================================
 
-def hill_climb(priority, verbose=True):
+def _divergence_tick(trace, key, rank):
+    """
+    First tick at which `key` has bought `rank` levels, i.e. the first tick
+    its pending (rank-th) purchase is looked at.  None if it never gets there.
+    """
+    if rank == 0:
+        return 0
+    ticks = trace.purchase_ticks[key]
+    if len(ticks) < rank:
+        return None
+    return ticks[rank - 1] + 1
+
+
+def _evaluate_swaps(priority, trace, swaps):
+    """
+    Score each swap (i, j), i < j, of priority given the base run's trace.
+    Returns [(i, j, score)], omitting swaps that cannot change the trajectory.
+    Runs in hill_climb()'s worker processes, so everything is passed in.
+    """
+    # before[pos][k] = occurrences of key k in priority[:pos]
+    before = [[0] * N_KEYS]
+    for kind, uid, _ in priority:
+        row = list(before[-1])
+        row[KEY_ID[(kind, uid)]] += 1
+        before.append(row)
+
+    scored = []
+    for i, j in swaps:
+        key_i, key_j = priority[i][:2], priority[j][:2]
+        t_i   = _divergence_tick(trace, key_i, before[i][KEY_ID[key_i]])
+        t_j   = _divergence_tick(trace, key_j, before[i][KEY_ID[key_j]])
+        ticks = [t for t in (t_i, t_j) if t is not None and t < trace.n_ticks]
+        if not ticks:
+            continue            # trajectory unchanged → same score as base
+
+        nbr       = list(priority)
+        nbr[i], nbr[j] = nbr[j], nbr[i]
+        state = trace.checkpoints[min(ticks) // CHECKPOINT_TICKS]
+        s = _resume_positions(_build_pos_map(nbr), *state)
+        scored.append((i, j, s))
+    return scored
+
+
+def hill_climb(priority, verbose=True, n_workers=None, seen=None, pool=None):
     """
     Try every pairwise swap (n*(n-1)/2 candidates).
     Apply the single best improvement found, then return.
     Call repeatedly until it returns improved=False to reach a local optimum.
+
+    Swapping positions i < j only changes the purchase order of the two items
+    involved, and only once item(i) has bought all its levels listed before i
+    or item(j) all its levels listed before i.  Until then the trajectory is
+    identical to the base run, so each swap resumes from the last checkpoint
+    before that tick — or is skipped outright if neither point is reached.
+
+    Swapping two steps of the same (kind, uid) is a no-op and is never
+    tried.  seen maps Zobrist hashes to scores; pass the same dict to
+    successive calls so orderings scored by an earlier pass aren't re-run.
+
+    base_score and the checkpoints come from the GameSim-driven
+    simulate_with_log(), while swaps are scored by the float-ms sim_core
+    kernels (or their _codegen twins).  Comparing the two is exact only under
+    sim_core's whole-ms spawn time assumption, which EVENT_CONFIG meets.
+
+    The swaps are split into n_workers chunks (default: one per CPU) and
+    scored on pool, a ProcessPoolExecutor; pass one to reuse it across calls,
+    as optimize() does.  Without one a pool is started for this call only.
     """
     n          = len(priority)
-    base_score = simulate(priority)
+    base_score, _, _, trace = simulate_with_log(priority)
     best_score = base_score
     best_i = best_j = -1
 
-    if verbose:
-        total = n * (n - 1) // 2
-        print(f"  Hill-climb: scanning {total} swaps…", end="", flush=True)
+    seen = {} if seen is None else seen
+    base_hash = _zobrist(priority)
+    seen[base_hash] = base_score
 
+    swaps   = []
+    hashes  = {}        # (i, j) → Zobrist hash of the swapped ordering
+    scored  = []
     for i in range(n):
+        p_i, z_i = priority[i][:2], _ZOBRIST[i]
         for j in range(i + 1, n):
-            nbr       = list(priority)
-            nbr[i], nbr[j] = nbr[j], nbr[i]
-            s = simulate(nbr)
-            if s > best_score:
-                best_score = s
-                best_i, best_j = i, j
+            p_j = priority[j][:2]
+            if p_i == p_j:
+                continue
+            z_j = _ZOBRIST[j]
+            h   = base_hash ^ z_i[p_i] ^ z_i[p_j] ^ z_j[p_j] ^ z_j[p_i]
+            s   = seen.get(h)
+            if s is None:
+                swaps.append((i, j))
+                hashes[(i, j)] = h
+            else:
+                scored.append((i, j, s))
+    n_workers = n_workers or os.cpu_count() or 1
+
+    if verbose:
+        print(f"  Hill-climb: scanning {len(swaps)} swaps…", end="", flush=True)
+
+    if n_workers > 1:
+        chunks = [swaps[w::n_workers] for w in range(n_workers)]
+        with (contextlib.nullcontext(pool) if pool is not None
+              else ProcessPoolExecutor(n_workers)) as ex:
+            results = ex.map(_evaluate_swaps, repeat(tuple(priority)), repeat(trace), chunks)
+            new     = [r for chunk in results for r in chunk]
+    else:
+        new = _evaluate_swaps(tuple(priority), trace, swaps)
+
+    # swaps _evaluate_swaps skipped leave the trajectory, hence the score, unchanged
+    new_scores = {(i, j): s for i, j, s in new}
+    for ij, h in hashes.items():
+        seen[h] = new_scores.get(ij, base_score)
+    scored += new
+
+    # sorted → ties go to the first swap in (i, j) order, as in a serial scan
+    for i, j, s in sorted(scored):
+        if s > best_score:
+            best_score = s
+            best_i, best_j = i, j
 
     if best_i >= 0:
         result = list(priority)
@@ -306,11 +563,18 @@ def hill_climb(priority, verbose=True):
 # Full optimisation pipeline
 # ============================================================
 
+def _sa_worker(args):
+    """Pool entry point: one independent SA restart, returns (priority, score)."""
+    n_iter, seed = args
+    return simulated_annealing(n_iter=n_iter, verbose=False, seed=seed)
+
+
 def optimize(n_iter=30_000,
              n_restarts=5,
              hill_climb_passes=3,
              verbose=True,
-             seed=None):
+             seed=None,
+             n_workers=None):
     """
     Multi-restart SA followed by exhaustive hill-climbing.
 
@@ -320,28 +584,47 @@ def optimize(n_iter=30_000,
         hill_climb_passes:  Max exhaustive swap passes after SA (stops early if no gain).
         verbose:            Print progress.
         seed:               Master random seed.
+        n_workers:          Processes for the SA restarts and hill-climb swaps
+                            (default: one per CPU).  One pool is started for
+                            the whole run; 1 runs everything in-process.
 
     Returns:
         (best_priority, best_score)
     """
-    if seed is not None:
-        random.seed(seed)
+    n_workers = n_workers or os.cpu_count() or 1
+    with (ProcessPoolExecutor(n_workers) if n_workers > 1
+          else contextlib.nullcontext()) as pool:
+        return _optimize(pool, n_workers, n_iter, n_restarts, hill_climb_passes,
+                         verbose, seed)
 
-    global_best       = None
-    global_best_score = 0.0
 
-    for r in range(n_restarts):
+def _optimize(pool, n_workers, n_iter, n_restarts, hill_climb_passes, verbose, seed):
+    """optimize() on an already started pool (None = in-process)."""
+    # Restart seeds are all drawn up front so results don't depend on n_workers
+    master = random.Random(seed)
+    seeds  = [master.randint(0, 2 ** 31) for _ in range(n_restarts)]
+
+    if pool is not None and n_restarts > 1:
         if verbose:
-            print(f"\n{'─'*60}")
-            print(f"  SA restart {r + 1} / {n_restarts}")
-            print(f"{'─'*60}")
+            print(f"\n  Running {n_restarts} SA restarts on "
+                  f"{min(n_restarts, n_workers)} processes…")
+        results = list(pool.map(_sa_worker, [(n_iter, s) for s in seeds]))
+    else:
+        results = []
+        for r, sub_seed in enumerate(seeds):
+            if verbose:
+                print(f"\n{'─'*60}")
+                print(f"  SA restart {r + 1} / {n_restarts}")
+                print(f"{'─'*60}")
+            results.append(simulated_annealing(n_iter=n_iter, verbose=verbose, seed=sub_seed))
 
-        sub_seed         = random.randint(0, 2 ** 31)
-        priority, score  = simulated_annealing(n_iter=n_iter, verbose=verbose, seed=sub_seed)
+    global_best       = None
+    global_best_score = 0.0
 
+    for r, (priority, score) in enumerate(results):
         if verbose:
             tag = "  *** new global best ***" if score > global_best_score else ""
-            print(f"  Restart score: {score/1e9:.3f}B{tag}")
+            print(f"  Restart {r + 1} score: {score/1e9:.3f}B{tag}")
 
         if score > global_best_score:
             global_best       = list(priority)
@@ -352,10 +635,13 @@ def optimize(n_iter=30_000,
         print(f"  Best across {n_restarts} restarts: {global_best_score/1e9:.3f}B")
         print(f"  Running up to {hill_climb_passes} hill-climb passes…")
 
+    seen = {}       # shared across passes: Zobrist hash → score
     for p in range(hill_climb_passes):
         if verbose:
             print(f"\n  Pass {p + 1} / {hill_climb_passes}")
-        global_best, global_best_score, improved = hill_climb(global_best, verbose=verbose)
+        global_best, global_best_score, improved = hill_climb(global_best, verbose=verbose,
+                                                              n_workers=n_workers, seen=seen,
+                                                              pool=pool)
         if not improved:
             if verbose:
                 print("  Converged — stopping early.")
@@ -0,0 +1,286 @@
+# ============================================
+# sim_core — compiled priority-list simulator
+# ============================================
+# Flat-array counterpart of GameSim plus the optimizer's per-tick purchase loop.
+# Works on the NumPy tables config.py flattens EVENT_CONFIG into at import,
+# indexed by a dense item id (creatures first, then boosts), so the kernel
+# never touches a dict.  Compiled with Numba when it is installed; otherwise
+# the same code runs as plain Python (identical results, much slower).
+#
+# The priority kernels keep creature progress in float ms, with float spawn
+# times spawn_time * speed; GameSim counts integer µs against spawn times
+# rounded to the µs.  The two agree tick for tick, and score bit for bit the
+# same, only while every boosted spawn time and step_ms are whole ms, so that
+# each float ms value is an exact integer.  That holds for EVENT_CONFIG, whose
+# boosted spawn times are all multiples of 50 ms; for a config where it
+# doesn't, the kernels and GameSim can drift apart.
+
+import numpy as np
+
+from config import BOOST_DAMAGE, BOOST_PRODUCTION, BOOST_SPEED
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+# How often (in ticks) resume_priority() re-checks whether any remaining
+# purchase is still reachable; the check costs about as much as a few ticks.
+WALL_CHECK_TICKS = 128
+
+
+# ============================================================
+# Kernel
+# ============================================================
+
+@njit(cache=True)
+def _boost_effects(levels, n_creatures, boost_type, boost_resource, bonus, prod_bonus):
+    """
+    Mirror of GameSim.get_speed_multiplier / get_damage_multiplier /
+    get_production_bonus: the first boost of each kind with lv > 0 wins.
+    Fills prod_bonus in place and returns (speed, dmg_mult).
+    """
+    speed     = 1.0
+    dmg_mult  = 1.0
+    have_spd  = False
+    have_dmg  = False
+    prod_bonus[:] = 0.0
+    have_prod = np.zeros(prod_bonus.shape[0], dtype=np.bool_)
+
+    for j in range(boost_type.shape[0]):
+        lv = levels[n_creatures + j]
+        if lv == 0:
+            continue
+        t = boost_type[j]
+        if t == BOOST_SPEED and not have_spd:
+            speed    = 1.0 - bonus[j, lv]
+            have_spd = True
+        elif t == BOOST_DAMAGE and not have_dmg:
+            dmg_mult = 1.0 + bonus[j, lv]
+            have_dmg = True
+        elif t == BOOST_PRODUCTION:
+            r = boost_resource[j]
+            if not have_prod[r]:
+                prod_bonus[r] = bonus[j, lv]
+                have_prod[r]  = True
+    return speed, dmg_mult
+
+
+@njit(cache=True)
+def simulate_priority(positions, cost, start_levels, spawn_time, produces,
+                      production, damage, boost_type, boost_resource, bonus,
+                      duration_ms, step_ms):
+    """
+    Run one full event following a priority ordering; returns total damage.
+
+    positions[k, s] is the priority-list index of the s-th purchase of item k
+    (see optimizer._build_pos_map).  Each tick buys the affordable item with
+    the lowest next position (levels the list doesn't include, padded with the
+    sentinel, are never bought), then advances every active creature by
+    step_ms as GameSim.advance does — identically under the whole-ms spawn
+    time assumption in the module header.
+    """
+    return resume_priority(positions,
+                           np.zeros(positions.shape[0], dtype=np.int64),
+                           np.zeros(cost.shape[2]),
+                           np.zeros(spawn_time.shape[0]),
+                           0.0, 0.0,
+                           cost, start_levels, spawn_time, produces,
+                           production, damage, boost_type, boost_resource, bonus,
+                           duration_ms, step_ms)
+
+
+@njit(cache=True)
+def resume_priority(positions, counts, resources, progress, total, elapsed,
+                    cost, start_levels, spawn_time, produces,
+                    production, damage, boost_type, boost_resource, bonus,
+                    duration_ms, step_ms):
+    """
+    Like simulate_priority() but starting from a mid-event state: purchases
+    made so far per item (counts), resources, creature progress, damage dealt
+    and elapsed ms, with progress in float ms by creature slot.  The input
+    arrays are not modified.
+    """
+    n_items     = positions.shape[0]
+    n_creatures = spawn_time.shape[0]
+    n_res       = cost.shape[2]
+
+    counts     = counts.copy()
+    resources  = resources.copy()
+    progress   = progress.copy()
+    levels     = start_levels + counts
+    prod_bonus = np.zeros(n_res)
+    speed, dmg_mult = _boost_effects(levels, n_creatures, boost_type,
+                                     boost_resource, bonus, prod_bonus)
+    sentinel = positions.max()      # padding after an item's last listed level
+    cap      = np.empty(n_res)
+
+    # purchases still listed in the priority
+    n_left = 0
+    for k in range(n_items):
+        for s in range(counts[k], positions.shape[1]):
+            if positions[k, s] < sentinel:
+                n_left += 1
+
+    tick = 0
+    while elapsed < duration_ms:
+        # ---- Early exit: nothing left that could ever be bought ----
+        if n_left == 0:
+            break
+        if tick % WALL_CHECK_TICKS == 0 and not _purchase_reachable(
+                positions, sentinel, counts, resources, progress, levels, cost,
+                spawn_time, produces, production, prod_bonus, speed,
+                duration_ms - elapsed, cap):
+            break
+
+        # ---- Purchase: highest-priority affordable item ----
+        # starting at the sentinel skips levels the priority doesn't list
+        best_pos = sentinel
+        best_k   = -1
+        for k in range(n_items):
+            s = counts[k]
+            p = positions[k, s]
+            if p >= best_pos:
+                continue
+            ok = True
+            for r in range(n_res):
+                if resources[r] < cost[k, s, r]:
+                    ok = False
+                    break
+            if ok:
+                best_pos = p
+                best_k   = k
+
+        if best_k >= 0:
+            s = counts[best_k]
+            for r in range(n_res):
+                resources[r] -= cost[best_k, s, r]
+            counts[best_k] += 1
+            levels[best_k] += 1
+            if best_k >= n_creatures:
+                speed, dmg_mult = _boost_effects(levels, n_creatures, boost_type,
+                                                 boost_resource, bonus, prod_bonus)
+            if best_pos < sentinel:     # n_left counts listed purchases only
+                n_left -= 1
+
+        # ---- Advance (GameSim.advance in float ms; see module header) ----
+        for i in range(n_creatures):
+            lv = levels[i]
+            if lv == 0:
+                continue
+            st = spawn_time[i] * speed
+            progress[i] += step_ms
+            ticks = int(progress[i] / st)
+            if ticks == 0:
+                continue
+            progress[i] -= ticks * st
+            prod = production[i, lv] + prod_bonus[produces[i]]
+            dmg  = damage[i, lv] * dmg_mult
+            resources[produces[i]] += prod * ticks
+            total += dmg * ticks
+
+        elapsed += step_ms
+        tick    += 1
+
+    if elapsed < duration_ms:
+        # Nothing can be bought any more, so every rate is fixed: count the
+        # remaining ticks, then each creature's spawns over them in one go.
+        n_steps = 0
+        while elapsed < duration_ms:
+            elapsed += step_ms
+            n_steps += 1
+        for i in range(n_creatures):
+            lv = levels[i]
+            if lv == 0:
+                continue
+            st    = spawn_time[i] * speed
+            ticks = int((progress[i] + n_steps * step_ms) / st)
+            total += damage[i, lv] * dmg_mult * ticks
+
+    return total
+
+
+@njit(cache=True)
+def _purchase_reachable(positions, sentinel, counts, resources, progress, levels,
+                        cost, spawn_time, produces, production, prod_bonus, speed,
+                        remaining_ms, cap):
+    """
+    False if no listed next purchase (position below sentinel) can become
+    affordable before the end, assuming nothing else is bought: each resource
+    is bounded by its current amount plus an over-estimate of what the active
+    creatures still produce.
+    """
+    n_creatures = spawn_time.shape[0]
+    cap[:] = resources
+    for i in range(n_creatures):
+        lv = levels[i]
+        if lv == 0:
+            continue
+        spawns = (progress[i] + remaining_ms) / (spawn_time[i] * speed) + 1.0
+        cap[produces[i]] += (production[i, lv] + prod_bonus[produces[i]]) * spawns
+
+    for k in range(counts.shape[0]):
+        s = counts[k]
+        if positions[k, s] >= sentinel:
+            continue
+        ok = True
+        for r in range(cap.shape[0]):
+            if cost[k, s, r] > cap[r]:
+                ok = False
+                break
+        if ok:
+            return True
+    return False
+
+
+# ============================================================
+# GameSim.advance
+# ============================================================
+
+@njit(cache=True)
+def advance_creatures(progress, eff_spawn, prod_rate, dmg_rate, produces, slots,
+                      delta, resources, damage_acc):
+    """
+    GameSim.advance over its per-slot arrays, in place: integer progress and
+    spawn times (µs), production / damage per spawn, and the one-element
+    damage accumulator.  Only the active creature slots (ascending) are
+    visited; adds in slot order, like the NumPy version.
+    """
+    total = damage_acc[0]
+    for i in slots:
+        p     = progress[i] + delta
+        ticks = p // eff_spawn[i]
+        progress[i] = p - ticks * eff_spawn[i]
+        if ticks == 0:
+            continue
+        resources[produces[i]] += prod_rate[i] * ticks
+        total += dmg_rate[i] * ticks
+    damage_acc[0] = total
+
+
+@njit(cache=True)
+def advance_creatures_until(progress, eff_spawn, prod_rate, dmg_rate, produces, slots,
+                            delta, n_steps, resources, damage_acc, stop_costs):
+    """
+    Up to n_steps calls of advance_creatures(), stopping after the first one
+    that leaves any row of stop_costs affordable.  Returns the steps taken.
+    """
+    for step in range(n_steps):
+        advance_creatures(progress, eff_spawn, prod_rate, dmg_rate, produces, slots,
+                          delta, resources, damage_acc)
+        for k in range(stop_costs.shape[0]):
+            ok = True
+            for r in range(resources.shape[0]):
+                if resources[r] < stop_costs[k, r]:
+                    ok = False
+                    break
+            if ok:
+                return step + 1
+    return n_steps
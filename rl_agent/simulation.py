@@ -4,12 +4,132 @@
 # Deterministic simulation of one full event run.
 # No rendering; purely arithmetic for speed.
 
-from config import EVENT_CONFIG
+import array
+import itertools
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from config import (BOOST_BY_ID, BOOST_DAMAGE, BOOST_PRODUCTION, BOOST_SPEED,
+                    CREATURE_BY_ID, EVENT_CONFIG, FLAT, ITEM_KEYS, RESOURCE_BY_ID,
+                    flatten_config, index_maps)
+from _codegen import specialize_advance
+from sim_core import HAVE_NUMBA, advance_creatures, advance_creatures_until
+
+# Creature progress is kept as an integer count of 1/PROGRESS_UNITS ms (µs), so
+# advance() splits it into spawns and remainder with one integer divmod.
+PROGRESS_UNITS = 1000
+
+
+def _cost_pairs(cost):
+    """
+    cost[item_id, step] rows as [item_id][step] tuples of (resource index,
+    amount) over the resources actually charged, or None for an all-inf
+    (unpurchasable) row.  Comparing / subtracting just those skips the zeros.
+    """
+    return [[None if np.isinf(row).all()
+             else tuple((r, amount) for r, amount in enumerate(row.tolist()) if amount)
+             for row in item]
+            for item in cost]
+
+
+def _upgrade_costs(config):
+    """
+    Next-purchase cost dicts as [creature slot][lv] and [boost slot][lv]
+    tuples (None when there is none), where lv is the current level and a
+    locked creature is at level 0.  Mirrors game.js's cost lookups.
+    """
+    creatures = tuple(
+        (c.get('unlockCost'),)                          # None if free (Fiona)
+        + tuple(c['upgradeCosts'][lv - 1] for lv in range(1, c['maxLevel']))
+        + (None,)
+        for c in config['creatures'])
+    boosts = tuple(tuple(b['costs'][:b['maxLevel']]) + (None,)
+                   for b in config.get('boosts', []))
+    return creatures, boosts
+
+
+# Everything GameSim derives from a config, frozen into tuples (indexed by
+# creature slot i / boost slot j / item id) so the per-tick code never does a
+# string-keyed lookup; uids are mapped to those indices by the (shared,
+# read-only) uid → index dicts.  Built once at import for EVENT_CONFIG, whose
+# maps are config.RESOURCE_BY_ID / CREATURE_BY_ID / BOOST_BY_ID.  Without Numba
+# it also carries run_interval's config-specialized advance step (_codegen).
+Frozen = namedtuple('Frozen', [
+    'keys', 'flat', 'cost_pairs',
+    'resource_index', 'creature_idx', 'boost_idx',      # uid → index
+    'spawn_time', 'produces', 'production', 'damage',   # [i], [i], [i][lv], [i][lv]
+    'bonus', 'boost_type', 'boost_resource',             # [j][lv], [j], [j]
+    'creature_costs', 'boost_costs',                    # [i][lv], [j][lv]
+    'advance',
+])
+
+
+def _advance_step(produces, n_res):
+    """run_interval's generated advance step without Numba (see _codegen), else None."""
+    return None if HAVE_NUMBA else specialize_advance(produces, n_res)
+
+
+def freeze_config(config):
+    if config is EVENT_CONFIG:
+        keys, flat = ITEM_KEYS, FLAT
+        maps = RESOURCE_BY_ID, CREATURE_BY_ID, BOOST_BY_ID
+    else:
+        keys, flat = flatten_config(config)
+        maps = index_maps(config)
+    creature_costs, boost_costs = _upgrade_costs(config)
+    produces = tuple(flat.produces.tolist())
+    return Frozen(
+        keys           = keys,
+        flat           = flat,
+        cost_pairs     = _cost_pairs(flat.cost),
+        resource_index = maps[0],
+        creature_idx   = maps[1],
+        boost_idx      = maps[2],
+        spawn_time     = tuple(flat.spawn_time.tolist()),
+        produces       = produces,
+        production     = tuple(map(tuple, flat.production.tolist())),
+        damage         = tuple(map(tuple, flat.damage.tolist())),
+        bonus          = tuple(map(tuple, flat.bonus.tolist())),
+        boost_type     = tuple(flat.boost_type.tolist()),
+        boost_resource = tuple(flat.boost_resource.tolist()),
+        creature_costs = creature_costs,
+        boost_costs    = boost_costs,
+        advance        = _advance_step(produces, flat.cost.shape[2]),
+    )
+
+
+_FROZEN_DEFAULT = freeze_config(EVENT_CONFIG)
 
 
 class GameSim:
     """Fast simulation of the Idle Apocalypse idle game engine."""
 
+    # Fixed attribute layout: no per-instance __dict__, and attribute access
+    # goes through slot descriptors.  New attributes must be listed here.
+    __slots__ = (
+        # config and derived tables (set once in __init__)
+        'config', 'duration_ms',
+        '_creatures', '_boosts', '_creature_order', '_boost_order',
+        '_item_id', '_creature_idx', '_boost_idx', '_resource_index',
+        '_start_levels', '_cost_table', '_cost_pairs',
+        '_spawn_time', '_produces', '_production', '_damage', '_bonus',
+        '_boost_type', '_boost_resource',
+        '_spawn_base', '_produces_arr', '_prod_table', '_dmg_table', '_rows',
+        '_creature_costs', '_boost_costs', '_creature_names', '_boost_labels',
+        '_items', '_no_stop', '_advance',
+        '_dps_cache',
+        # run state (set in reset)
+        'resources_vec', '_levels', '_unlocked', '_progress_q',
+        '_boost_lv', '_damage_acc', 'time_elapsed_ms',
+        # boost effects of the current boost levels (see _refresh_boosts)
+        '_speed_mult', '_dmg_mult', '_prod_bonus',
+        # per-slot rates at the current levels (see _refresh_rates)
+        '_active', '_active_slots', '_eff_spawn_q', '_prod_rate', '_dmg_rate',
+        '_total_dps',
+    )
+
     def __init__(self, config=None):
         self.config = config or EVENT_CONFIG
         self.duration_ms = self.config['duration']
@@ -19,54 +139,202 @@ class GameSim:
         self._boosts = {b['id']: b for b in self.config.get('boosts', [])}
         self._creature_order = [c['id'] for c in self.config['creatures']]
         self._boost_order = [b['id'] for b in self.config.get('boosts', [])]
+        # display names by slot, for summary()
+        self._creature_names = tuple(c['name'] for c in self.config['creatures'])
+        self._boost_labels   = tuple((b['name'], b['maxLevel'])
+                                     for b in self.config.get('boosts', []))
+
+        # Integer-indexed tables from the flattened config.  uids are mapped to
+        # indices at the API boundary; internals index by creature slot i.
+        # Resources are a float64 vector (resources_vec), and
+        # _cost_table[item_id, step] is the cost row of an item's step-th purchase.
+        frozen = (_FROZEN_DEFAULT if self.config is EVENT_CONFIG
+                  else freeze_config(self.config))
+        keys, flat = frozen.keys, frozen.flat
+        self._item_id        = {key: k for k, key in enumerate(keys)}
+        self._creature_idx   = frozen.creature_idx
+        self._boost_idx      = frozen.boost_idx
+        self._resource_index = frozen.resource_index
+        self._start_levels   = flat.start_levels
+        self._cost_table     = flat.cost
+        self._cost_pairs     = frozen.cost_pairs            # [item_id][step]
+        # scalar tables as tuples: indexing one beats indexing a NumPy array
+        self._spawn_time     = frozen.spawn_time
+        self._produces       = frozen.produces
+        self._production     = frozen.production            # [i][lv]
+        self._damage         = frozen.damage                # [i][lv]
+        self._bonus          = frozen.bonus                 # [j][lv], boost slot j
+        self._boost_type     = frozen.boost_type            # BOOST_* codes
+        self._boost_resource = frozen.boost_resource
+        self._creature_costs = frozen.creature_costs       # [i][lv] cost dicts
+        self._boost_costs    = frozen.boost_costs          # [j][lv]
+        # ... and as arrays for the per-slot (SoA) state advance() works on
+        self._spawn_base     = flat.spawn_time
+        self._produces_arr   = flat.produces
+        self._prod_table     = flat.production
+        self._dmg_table      = flat.damage
+        self._rows           = np.arange(len(self._creature_order))
+        self._items          = np.arange(len(keys))
+        self._no_stop        = np.zeros((0, len(self._resource_index)))
+        self._advance        = frozen.advance
+
+        # DPS is a pure function of the level vectors; memoized across resets
+        self._dps_cache = {}
 
         self.reset()
 
     def reset(self):
-        self.resources = {r['id']: 0.0 for r in self.config['resources']}
-        self.creature_levels = {}
-        self.creature_unlocked = {}
-        self.creature_progress = {}     # ms accumulated since last spawn
-        for c in self.config['creatures']:
-            cid = c['id']
-            self.creature_unlocked[cid] = bool(c.get('unlockedByDefault', False))
-            self.creature_levels[cid] = 1 if c.get('unlockedByDefault') else 0
-            self.creature_progress[cid] = 0.0
-
-        self.boost_levels = {bid: 0 for bid in self._boost_order}
-        self.total_damage = 0.0
+        # balances by resource index; `resources` is the dict view by id
+        self.resources_vec = np.zeros(len(self._resource_index))
+        # 1 / 0 by creature slot; `creature_unlocked` is the dict view by id
+        self._unlocked = array.array(
+            'b', [bool(c.get('unlockedByDefault', False)) for c in self.config['creatures']])
+        # µs accumulated since last spawn, by creature slot; see creature_progress
+        self._progress_q = np.zeros(len(self._creature_order), dtype=np.int64)
+
+        # levels as int8 arrays indexed by creature / boost slot; see level()
+        # and the creature_levels / boost_levels dict views
+        self._levels = array.array(
+            'b', [1 if c.get('unlockedByDefault') else 0 for c in self.config['creatures']])
+        self._boost_lv = array.array('b', bytes(len(self._boost_order)))
+        self._refresh_boosts()
+        self._refresh_rates()
+        self._damage_acc = np.zeros(1)
         self.time_elapsed_ms = 0.0
 
+    def __copy__(self):
+        """
+        An independent sim in the same state.  The run state updated in place
+        (balances, progress, damage, levels) is copied; the config tables and
+        the rate arrays, which are only ever replaced, are shared.
+        """
+        new = GameSim.__new__(GameSim)
+        for name in GameSim.__slots__:
+            setattr(new, name, getattr(self, name))
+        new.resources_vec = self.resources_vec.copy()
+        new._progress_q   = self._progress_q.copy()
+        new._damage_acc   = self._damage_acc.copy()
+        new._levels       = array.array('b', self._levels)
+        new._boost_lv     = array.array('b', self._boost_lv)
+        new._unlocked     = array.array('b', self._unlocked)
+        return new
+
+    # The generated advance step (no Numba) is an exec'd function, which
+    # pickle can't store; drop it and rebuild it from the cached generator.
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in GameSim.__slots__
+                if name != '_advance'}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._advance = _advance_step(self._produces, len(self._resource_index))
+
+    @property
+    def resources(self):
+        """Resource balances by resource id (a snapshot dict of resources_vec)."""
+        return dict(zip(self._resource_index, self.resources_vec.tolist()))
+
+    @property
+    def creature_levels(self):
+        """Level of each creature, by creature id (a snapshot dict; locked = 0)."""
+        return dict(zip(self._creature_order, self._levels))
+
+    @property
+    def boost_levels(self):
+        """Level of each boost, by boost id (a snapshot dict)."""
+        return dict(zip(self._boost_order, self._boost_lv))
+
+    @property
+    def creature_unlocked(self):
+        """Whether each creature is unlocked, by creature id (a snapshot dict)."""
+        return {cid: bool(u) for cid, u in zip(self._creature_order, self._unlocked)}
+
+    @property
+    def creature_progress(self):
+        """ms accumulated since each creature's last spawn, by creature id (a snapshot dict)."""
+        return dict(zip(self._creature_order, (self._progress_q / PROGRESS_UNITS).tolist()))
+
+    @property
+    def total_damage(self):
+        return float(self._damage_acc[0])
+
+    @total_damage.setter
+    def total_damage(self, value):
+        self._damage_acc[0] = value
+
+    def level(self, kind, uid):
+        """Current level of creature/boost uid (0 = locked / not bought)."""
+        if kind == 'creature':
+            return self._levels[self._creature_idx[uid]]
+        return self._boost_lv[self._boost_idx[uid]]
+
     # ----------------------------------------------------------
     # Boost multipliers  (mirrors game.js helpers)
     # ----------------------------------------------------------
+    # The current boost levels' effects are cached; only buying a boost (or
+    # reset()) changes them.  Passing boost_levels computes them afresh.
 
-    def get_speed_multiplier(self):
-        for bid in self._boost_order:
-            b = self._boosts[bid]
-            if b['type'] == 'speed':
-                lv = self.boost_levels[bid]
-                if lv > 0:
-                    return 1.0 - b['bonusByLevel'][lv - 1]
-        return 1.0
-
-    def get_damage_multiplier(self):
-        for bid in self._boost_order:
-            b = self._boosts[bid]
-            if b['type'] == 'damage':
-                lv = self.boost_levels[bid]
-                if lv > 0:
-                    return 1.0 + b['bonusByLevel'][lv - 1]
-        return 1.0
+    def _refresh_boosts(self):
+        self._speed_mult, self._dmg_mult, self._prod_bonus = self._scan_boosts(self._boost_lv)
+
+    def get_speed_multiplier(self, boost_levels=None):
+        if boost_levels is None:
+            return self._speed_mult
+        return self._scan_boosts(boost_levels)[0]
+
+    def get_damage_multiplier(self, boost_levels=None):
+        if boost_levels is None:
+            return self._dmg_mult
+        return self._scan_boosts(boost_levels)[1]
 
     def get_production_bonus(self, resource_id):
-        for bid in self._boost_order:
-            b = self._boosts[bid]
-            if b['type'] == 'production-bonus' and b.get('resource') == resource_id:
-                lv = self.boost_levels[bid]
-                if lv > 0:
-                    return float(b['bonusByLevel'][lv - 1])
-        return 0.0
+        return self._prod_bonus[self._resource_index[resource_id]]
+
+    def _refresh_rates(self):
+        """
+        Per-slot arrays for advance(): active (1 / 0) and the active slots
+        themselves, spawn time after the speed boost in µs, and production /
+        damage per spawn at the current levels; plus the total DPS get_dps()
+        returns.  Rerun whenever a level changes.
+        """
+        lv     = np.array(self._levels, dtype=np.intp)
+        active = (lv > 0) & np.array(self._unlocked, dtype=bool)
+        self._active       = active.astype(np.int64)
+        self._active_slots = np.flatnonzero(active)
+        self._eff_spawn_q = np.rint(self._spawn_base * self._speed_mult
+                                    * PROGRESS_UNITS).astype(np.int64)
+        self._prod_rate = (self._prod_table[self._rows, lv]
+                           + np.array(self._prod_bonus)[self._produces_arr])
+        self._dmg_rate  = self._dmg_table[self._rows, lv] * self._dmg_mult
+        self._total_dps = self.dps_for(*self.level_key())
+
+    def _scan_boosts(self, boost_levels):
+        """
+        (speed multiplier, damage multiplier, production bonus by resource
+        index) for boost_levels, in one pass over the boosts.  As in game.js
+        the first boost of each kind with lv > 0 wins.
+        """
+        bonus, resource = self._bonus, self._boost_resource
+        speed = dmg = None
+        prod  = [None] * len(self._resource_index)
+        for j, t in enumerate(self._boost_type):
+            lv = boost_levels[j]
+            if lv == 0:
+                continue
+            if t == BOOST_SPEED:
+                if speed is None:
+                    speed = 1.0 - bonus[j][lv]
+            elif t == BOOST_DAMAGE:
+                if dmg is None:
+                    dmg = 1.0 + bonus[j][lv]
+            elif t == BOOST_PRODUCTION:
+                r = resource[j]
+                if prod[r] is None:
+                    prod[r] = bonus[j][lv]
+        return (1.0 if speed is None else speed,
+                1.0 if dmg is None else dmg,
+                [0.0 if p is None else p for p in prod])
 
     # ----------------------------------------------------------
     # Creature stats
@@ -77,28 +345,60 @@ class GameSim:
         return creature['spawnTime'] * self.get_speed_multiplier()
 
     def get_creature_production(self, cid):
-        c = self._creatures[cid]
-        lv = self.creature_levels[cid]
-        if not self.creature_unlocked[cid] or lv == 0:
+        i = self._creature_idx[cid]
+        lv = self._levels[i]
+        if not self._unlocked[i] or lv == 0:
             return 0.0
-        return float(c['productionByLevel'][lv - 1]) + self.get_production_bonus(c['produces'])
+        return self._production[i][lv] + self._prod_bonus[self._produces[i]]
 
     def get_creature_damage(self, cid):
-        c = self._creatures[cid]
-        lv = self.creature_levels[cid]
-        if not self.creature_unlocked[cid] or lv == 0:
+        i = self._creature_idx[cid]
+        lv = self._levels[i]
+        if not self._unlocked[i] or lv == 0:
             return 0.0
-        return float(c['damageByLevel'][lv - 1]) * self.get_damage_multiplier()
+        return self._damage[i][lv] * self._dmg_mult
 
     def get_dps(self):
-        """Total damage per second across all active creatures."""
+        """Total damage per second across all active creatures (cached)."""
+        return self._total_dps
+
+    def level_key(self):
+        """(creature levels, boost levels) as tuples in config order; locked = 0."""
+        creatures = tuple(lv if u else 0
+                          for lv, u in zip(self._levels, self._unlocked))
+        boosts = tuple(self._boost_lv)
+        return creatures, boosts
+
+    def get_dps_after(self, kind, uid):
+        """DPS if the next level of creature/boost uid were bought (sim untouched)."""
+        creatures, boosts = self.level_key()
+        if kind == 'creature':
+            i = self._creature_idx[uid]
+            creatures = creatures[:i] + (creatures[i] + 1,) + creatures[i + 1:]
+        else:
+            j = self._boost_idx[uid]
+            boosts = boosts[:j] + (boosts[j] + 1,) + boosts[j + 1:]
+        return self.dps_for(creatures, boosts)
+
+    def dps_for(self, creature_levels, boost_levels):
+        """Memoized DPS for level tuples as returned by level_key()."""
+        key = (creature_levels, boost_levels)
+        dps = self._dps_cache.get(key)
+        if dps is None:
+            dps = self._compute_dps(creature_levels, boost_levels)
+            self._dps_cache[key] = dps
+        return dps
+
+    def _compute_dps(self, creature_levels, boost_levels):
+        speed    = self.get_speed_multiplier(boost_levels)
+        dmg_mult = self.get_damage_multiplier(boost_levels)
+        spawn_time, damage = self._spawn_time, self._damage
         total = 0.0
-        for cid in self._creature_order:
-            if not self.creature_unlocked[cid] or self.creature_levels[cid] == 0:
+        for i, lv in enumerate(creature_levels):
+            if lv == 0:
                 continue
-            c = self._creatures[cid]
-            spawn_s = self.get_effective_spawn_time(c) / 1000.0
-            total += self.get_creature_damage(cid) / spawn_s
+            spawn_s = spawn_time[i] * speed / 1000.0
+            total += damage[i][lv] * dmg_mult / spawn_s
         return total
 
     # ----------------------------------------------------------
@@ -110,66 +410,116 @@ class GameSim:
         Advance the simulation by delta_ms milliseconds.
         Accumulates resources and damage from all active creatures.
         """
-        speed = self.get_speed_multiplier()
-        dmg_mult = self.get_damage_multiplier()
-
-        for cid in self._creature_order:
-            if not self.creature_unlocked[cid] or self.creature_levels[cid] == 0:
-                continue
-            c = self._creatures[cid]
-            lv = self.creature_levels[cid]
+        self.run_interval(delta_ms)
 
-            spawn_time = c['spawnTime'] * speed
-            self.creature_progress[cid] += delta_ms
-            ticks = int(self.creature_progress[cid] / spawn_time)
-            if ticks == 0:
-                continue
-
-            self.creature_progress[cid] -= ticks * spawn_time
-            prod = float(c['productionByLevel'][lv - 1]) + self.get_production_bonus(c['produces'])
-            dmg  = float(c['damageByLevel'][lv - 1]) * dmg_mult
-
-            self.resources[c['produces']] += prod * ticks
-            self.total_damage += dmg * ticks
+    def run_interval(self, delta_ms):
+        """
+        Advance by delta_ms with every rate held constant, in closed form:
+        each creature's spawns over the whole interval come from one divmod
+        of its integer progress by its spawn time, so the cost is O(#creatures)
+        however long the interval is.  Spawn counts equal those of stepping
+        through the interval in pieces; the float sums may round differently.
+        """
+        d = round(delta_ms * PROGRESS_UNITS)
+        if HAVE_NUMBA:
+            advance_creatures(self._progress_q, self._eff_spawn_q, self._prod_rate,
+                              self._dmg_rate, self._produces_arr, self._active_slots,
+                              d, self.resources_vec, self._damage_acc)
+        else:
+            # the same slot loop unrolled for this config; locked creatures
+            # don't accumulate progress
+            self._advance(self._progress_q, self._eff_spawn_q, self._active,
+                          self._prod_rate, self._dmg_rate,
+                          d, self.resources_vec, self._damage_acc)
 
         self.time_elapsed_ms += delta_ms
 
+    def advance_bulk(self, n_steps, step_ms, stop_costs=None):
+        """
+        advance(step_ms) up to n_steps times in one call, with identical results.
+        If stop_costs (rows of cost vectors, e.g. next_costs()) is given, stop
+        after the first step that leaves any of them affordable.  Nothing can
+        be bought in between, so drivers use this to skip over idle ticks.
+        Returns the number of steps taken.
+        """
+        if stop_costs is None:
+            stop_costs = self._no_stop
+        if HAVE_NUMBA:
+            d     = round(step_ms * PROGRESS_UNITS)
+            taken = advance_creatures_until(self._progress_q, self._eff_spawn_q,
+                                            self._prod_rate, self._dmg_rate,
+                                            self._produces_arr, self._active_slots, d, n_steps,
+                                            self.resources_vec, self._damage_acc, stop_costs)
+            t = self.time_elapsed_ms
+            for _ in range(taken):
+                t += step_ms
+            self.time_elapsed_ms = t
+            return taken
+        run_interval = self.run_interval
+        for step in range(n_steps):
+            run_interval(step_ms)
+            if (self.resources_vec >= stop_costs).all(axis=1).any():
+                return step + 1
+        return n_steps
+
+    def steps_left(self, step_ms):
+        """Number of advance(step_ms) calls still needed until is_done()."""
+        return max(0, math.ceil((self.duration_ms - self.time_elapsed_ms) / step_ms))
+
     # ----------------------------------------------------------
     # Affordability
     # ----------------------------------------------------------
 
-    def can_afford(self, cost):
-        if cost is None:
+    def upgrade_step(self, kind, uid):
+        """(item_id, step) indexing _cost_table for the next purchase of kind/uid."""
+        k = self._item_id[(kind, uid)]
+        if kind == 'creature':
+            i  = self._creature_idx[uid]
+            lv = self._levels[i] if self._unlocked[i] else 0
+        else:
+            lv = self._boost_lv[self._boost_idx[uid]]
+        return k, lv - self._start_levels[k]
+
+    def next_costs(self):
+        """Cost row of every item's next purchase, by item id (all-inf if none)."""
+        levels = np.concatenate((self._levels, self._boost_lv))
+        return self._cost_table[self._items, levels - self._start_levels]
+
+    def can_afford(self, item_id, step):
+        pairs = self._cost_pairs[item_id][step]
+        if pairs is None:       # unavailable: maxed, or no unlock cost
             return False
-        return all(self.resources.get(r, 0.0) >= amt for r, amt in cost.items())
+        resources = self.resources_vec
+        for r, amount in pairs:
+            if resources[r] < amount:
+                return False
+        return True
 
-    def _spend(self, cost):
-        for r, amt in cost.items():
-            self.resources[r] -= amt
+    def _spend(self, item_id, step):
+        resources = self.resources_vec
+        for r, amount in self._cost_pairs[item_id][step]:
+            resources[r] -= amount
 
     # ----------------------------------------------------------
     # Creature upgrades
     # ----------------------------------------------------------
 
     def get_creature_upgrade_cost(self, cid):
-        c = self._creatures[cid]
-        if not self.creature_unlocked[cid]:
-            return c.get('unlockCost')         # None if free (Fiona)
-        lv = self.creature_levels[cid]
-        if lv >= c['maxLevel']:
-            return None
-        return c['upgradeCosts'][lv - 1]
+        i = self._creature_idx[cid]
+        return self._creature_costs[i][self._levels[i] if self._unlocked[i] else 0]
 
     def upgrade_creature(self, cid):
-        cost = self.get_creature_upgrade_cost(cid)
-        if cost is None or not self.can_afford(cost):
+        k, step = self.upgrade_step('creature', cid)
+        if not self.can_afford(k, step):
             return False
-        self._spend(cost)
-        if not self.creature_unlocked[cid]:
-            self.creature_unlocked[cid] = True
-            self.creature_levels[cid] = 1
+        self._spend(k, step)
+        i = self._creature_idx[cid]
+        if not self._unlocked[i]:
+            self._unlocked[i] = True
+            self._levels[i] = 1
         else:
-            self.creature_levels[cid] += 1
+            self._levels[i] += 1
+        self._refresh_rates()
         return True
 
     # ----------------------------------------------------------
@@ -177,18 +527,17 @@ class GameSim:
     # ----------------------------------------------------------
 
     def get_boost_upgrade_cost(self, bid):
-        b = self._boosts[bid]
-        lv = self.boost_levels[bid]
-        if lv >= b['maxLevel']:
-            return None
-        return b['costs'][lv]
+        j = self._boost_idx[bid]
+        return self._boost_costs[j][self._boost_lv[j]]
 
     def upgrade_boost(self, bid):
-        cost = self.get_boost_upgrade_cost(bid)
-        if cost is None or not self.can_afford(cost):
+        k, step = self.upgrade_step('boost', bid)
+        if not self.can_afford(k, step):
             return False
-        self._spend(cost)
-        self.boost_levels[bid] += 1
+        self._spend(k, step)
+        self._boost_lv[self._boost_idx[bid]] += 1
+        self._refresh_boosts()
+        self._refresh_rates()
         return True
 
     # ----------------------------------------------------------
@@ -203,15 +552,161 @@ class GameSim:
     # ----------------------------------------------------------
 
     def summary(self):
-        lines = [f"  Total damage : {self.total_damage:,.0f}"]
-        lines.append("  Creatures:")
-        for cid in self._creature_order:
-            lv  = self.creature_levels[cid]
-            unk = "unlocked" if self.creature_unlocked[cid] else "locked"
-            lines.append(f"    {self._creatures[cid]['name']:15s} Lv{lv:2d}  ({unk})")
-        lines.append("  Boosts:")
-        for bid in self._boost_order:
-            lv = self.boost_levels[bid]
-            mx = self._boosts[bid]['maxLevel']
-            lines.append(f"    {self._boosts[bid]['name']:20s} Lv{lv}/{mx}")
-        return "\n".join(lines)
+        creatures = (f"    {name:15s} Lv{lv:2d}  ({'unlocked' if u else 'locked'})"
+                     for name, lv, u in zip(self._creature_names, self._levels,
+                                            self._unlocked))
+        boosts = (f"    {name:20s} Lv{lv}/{mx}"
+                  for (name, mx), lv in zip(self._boost_labels, self._boost_lv))
+        return "\n".join(itertools.chain(
+            (f"  Total damage : {self.total_damage:,.0f}", "  Creatures:"),
+            creatures, ("  Boosts:",), boosts))
+
+
+class BatchedGameSim:
+    """
+    batch_size independent GameSims over one config, advanced together.
+
+    Run state is stacked into [B, …] arrays (row b is sim b) so one advance()
+    steps every sim with a few NumPy operations instead of B Python calls.
+    The config tables are built once, by a template GameSim, and shared by
+    the whole batch.  Row b matches a GameSim given the same purchases bit
+    for bit; check_batched.py verifies that over a full event.
+    """
+
+    __slots__ = (
+        'batch_size', 'config', 'duration_ms', '_sim', '_grid', '_res_index',
+        # run state (set in reset), by sim row b
+        'resources_vec', '_levels', '_unlocked', '_boost_levels', '_progress_q',
+        '_damage_acc', 'time_elapsed_ms',
+        # boost effects and per-slot rates, as in GameSim
+        '_speed_mult', '_dmg_mult', '_prod_bonus',
+        '_active', '_eff_spawn_q', '_prod_rate', '_dmg_rate',
+    )
+
+    def __init__(self, batch_size, config=None):
+        self._sim = GameSim(config)
+        self.config = self._sim.config
+        self.duration_ms = self._sim.duration_ms
+        self.batch_size = batch_size
+
+        # np.add.at indices: sim row of every (b, slot), and (b, resource
+        # produced by slot); both run row-major, i.e. in slot order per sim
+        n = len(self._sim._creature_order)
+        rows = np.arange(batch_size)[:, None]
+        self._grid      = np.repeat(rows, n, axis=1)
+        self._res_index = (rows, self._sim._produces_arr[None, :])
+
+        self.reset()
+
+    def reset(self):
+        sim = self._sim
+        sim.reset()
+        B = self.batch_size
+        self.resources_vec = np.zeros((B, len(sim._resource_index)))
+        self._levels   = np.tile(np.array(sim._levels, dtype=np.int32), (B, 1))
+        self._unlocked = np.tile(np.array(sim._unlocked, dtype=bool), (B, 1))
+        self._boost_levels = np.zeros((B, len(sim._boost_order)), dtype=np.int32)
+        self._progress_q   = np.zeros(self._levels.shape, dtype=np.int64)
+        self._damage_acc   = np.zeros(B)
+        self.time_elapsed_ms = 0.0
+
+        self._speed_mult = np.full(B, sim._speed_mult)
+        self._dmg_mult   = np.full(B, sim._dmg_mult)
+        self._prod_bonus = np.tile(np.array(sim._prod_bonus), (B, 1))
+        self._refresh_rates()
+
+    @property
+    def total_damage(self):
+        """Damage dealt so far, by sim row (a copy)."""
+        return self._damage_acc.copy()
+
+    def level(self, kind, uid):
+        """Level of creature/boost uid in every sim (a copy)."""
+        if kind == 'creature':
+            return self._levels[:, self._sim._creature_idx[uid]].copy()
+        return self._boost_levels[:, self._sim._boost_idx[uid]].copy()
+
+    def _refresh_boosts(self, rows):
+        """Recompute the boost effects of the given sim rows (GameSim._scan_boosts)."""
+        scan = self._sim._scan_boosts
+        for b in rows:
+            self._speed_mult[b], self._dmg_mult[b], self._prod_bonus[b] = scan(
+                self._boost_levels[b].tolist())
+
+    def _refresh_rates(self):
+        """GameSim._refresh_rates for every row at once."""
+        sim = self._sim
+        lv  = self._levels
+        self._active      = ((lv > 0) & self._unlocked).astype(np.int64)
+        self._eff_spawn_q = np.rint(sim._spawn_base * self._speed_mult[:, None]
+                                    * PROGRESS_UNITS).astype(np.int64)
+        self._prod_rate = (sim._prod_table[sim._rows, lv]
+                           + self._prod_bonus[:, sim._produces_arr])
+        self._dmg_rate  = sim._dmg_table[sim._rows, lv] * self._dmg_mult[:, None]
+
+    # ----------------------------------------------------------
+    # Simulation tick
+    # ----------------------------------------------------------
+
+    def advance(self, delta_ms):
+        """
+        Advance every sim by delta_ms milliseconds (GameSim.run_interval,
+        broadcast over the batch).  np.add.at adds in slot order within each
+        row, so every sim's sums round exactly as GameSim's.
+        """
+        d = round(delta_ms * PROGRESS_UNITS)
+        ticks, self._progress_q = np.divmod(self._progress_q + d * self._active,
+                                            self._eff_spawn_q)
+        np.add.at(self.resources_vec, self._res_index, self._prod_rate * ticks)
+        np.add.at(self._damage_acc, self._grid, self._dmg_rate * ticks)
+        self.time_elapsed_ms += delta_ms
+
+    def steps_left(self, step_ms):
+        """Number of advance(step_ms) calls still needed until is_done()."""
+        return max(0, math.ceil((self.duration_ms - self.time_elapsed_ms) / step_ms))
+
+    def is_done(self):
+        return self.time_elapsed_ms >= self.duration_ms
+
+    # ----------------------------------------------------------
+    # Upgrades
+    # ----------------------------------------------------------
+
+    def _next_cost(self, kind, uid):
+        """(item_id, slot, cost row of the next purchase of kind/uid by sim row)."""
+        sim = self._sim
+        k   = sim._item_id[(kind, uid)]
+        if kind == 'creature':
+            i  = sim._creature_idx[uid]
+            lv = self._levels[:, i]
+        else:
+            i  = sim._boost_idx[uid]
+            lv = self._boost_levels[:, i]
+        return k, i, sim._cost_table[k, lv - sim._start_levels[k]]
+
+    def can_afford(self, kind, uid):
+        """bool[B]: whether each sim can buy the next level of kind/uid."""
+        cost = self._next_cost(kind, uid)[2]
+        return (self.resources_vec >= cost).all(axis=1)
+
+    def upgrade(self, kind, uid, rows=None):
+        """
+        Buy the next level of creature/boost uid in every sim that can afford
+        it, or only in those selected by the bool[B] mask rows.  Returns the
+        bool[B] mask of sims that bought it.
+        """
+        k, i, cost = self._next_cost(kind, uid)
+        bought = (self.resources_vec >= cost).all(axis=1)
+        if rows is not None:
+            bought &= rows
+        if not bought.any():
+            return bought
+        self.resources_vec[bought] -= cost[bought]
+        if kind == 'creature':
+            self._levels[bought, i] += 1
+            self._unlocked[bought, i] = True
+        else:
+            self._boost_levels[bought, i] += 1
+            self._refresh_boosts(np.flatnonzero(bought))
+        self._refresh_rates()
+        return bought